@@ -10,12 +10,14 @@ from service import config
 from service.common import log_handlers
 from flask_talisman import Talisman
 from flask_cors import CORS
+from flask_compress import Compress
 
 # Create Flask application
 app = Flask(__name__)
 talisman = Talisman(app)
 CORS(app)
 app.config.from_object(config)
+Compress(app)
 
 # Import the routes After the Flask app is created
 # pylint: disable=wrong-import-position, cyclic-import, wrong-import-order
@@ -19,5 +19,21 @@ if not DATABASE_URI:
 SQLALCHEMY_DATABASE_URI = DATABASE_URI
 SQLALCHEMY_TRACK_MODIFICATIONS = False
 
+# Size the connection pool for expected concurrency; requests queue for
+# a connection once concurrent clients exceed pool_size + max_overflow
+SQLALCHEMY_ENGINE_OPTIONS = {
+    "pool_size": int(os.getenv("DATABASE_POOL_SIZE", "20")),
+    "max_overflow": int(os.getenv("DATABASE_MAX_OVERFLOW", "20")),
+    "pool_pre_ping": True,
+    "pool_recycle": 1800,
+    "pool_use_lifo": True,
+}
+
+# Configure response compression (zstd preferred, then brotli, gzip)
+COMPRESS_ALGORITHM = ["zstd", "br", "gzip"]
+COMPRESS_MIN_SIZE = 1024
+COMPRESS_LEVEL = 3
+COMPRESS_MIMETYPES = ["application/json"]
+
 # Secret for session management
 SECRET_KEY = os.getenv("SECRET_KEY", "s3cr3t-key-shhhh")
@@ -97,17 +97,6 @@ class Account(db.Model, PersistentBase):
     def __repr__(self):
         return f"<Account {self.name} id=[{self.id}]>"
 
-    def serialize(self):
-        """Serializes a Account into a dictionary"""
-        return {
-            "id": self.id,
-            "name": self.name,
-            "email": self.email,
-            "address": self.address,
-            "phone_number": self.phone_number,
-            "date_joined": self.date_joined.isoformat()
-        }
-
     def deserialize(self, data):
         """
         Deserializes a Account from a dictionary
@@ -143,3 +132,29 @@ class Account(db.Model, PersistentBase):
         """
         logger.info("Processing name query for %s ...", name)
         return cls.query.filter(cls.name == name)
+
+
+def _compile_serializer(cls):
+    """Generates a straight-line serialize() from the table's columns
+
+    Building the function source once at import time keeps
+    serialization in sync with the schema and avoids any per-call
+    column iteration or type dispatch.
+    """
+    parts = []
+    for column in cls.__table__.columns:
+        value = f"self.{column.name}"
+        if isinstance(column.type, db.Date):
+            value += ".isoformat()"
+        parts.append(f'"{column.name}": {value}')
+    source = (
+        "def serialize(self):\n"
+        '    """Serializes a Account into a dictionary"""\n'
+        "    return {" + ", ".join(parts) + "}\n"
+    )
+    namespace = {}
+    exec(source, namespace)  # pylint: disable=exec-used
+    return namespace["serialize"]
+
+
+Account.serialize = _compile_serializer(Account)
@@ -3,20 +3,79 @@ Account Service
 
 This microservice handles the lifecycle of Accounts
 """
+import hashlib
+import io
+import logging
+import sys
+from datetime import date
+from typing import List, Optional, Union
+
+import msgspec
+import orjson
+
 # pylint: disable=unused-import
 from flask import jsonify, request, make_response, abort, url_for   # noqa; F401
-from service.models import Account
+from sqlalchemy import insert, text
+import psycopg2
+from service.models import Account, DataValidationError, db
 from service.common import status  # HTTP Status Codes
 from . import app  # Import Flask application
 
 
+class AccountIn(msgspec.Struct):
+    """Typed request payload for creating or updating an Account
+
+    msgspec parses the raw request bytes straight into this struct,
+    fusing JSON decode and field validation into a single pass.
+    """
+
+    name: str
+    email: str
+    address: str
+    phone_number: Optional[str] = None
+    date_joined: Optional[date] = None
+
+
+def _decode_payload(payload_type):
+    """Decodes the request body into the given msgspec type
+
+    Each handler decodes exactly once, so cache=False lets werkzeug
+    release the raw body bytes instead of holding them for the rest of
+    the request.
+    """
+    try:
+        return msgspec.json.decode(request.get_data(cache=False), type=payload_type)
+    except msgspec.DecodeError as error:
+        raise DataValidationError("Invalid Account: " + str(error)) from error
+
+
+# Fixed-shape responses are encoded once at import time so the hot
+# path (k8s probes hit /health constantly) skips dict construction
+# and JSON encoding entirely
+_HEALTH_BODY = b'{"status":"OK"}'
+_INDEX_BODY = orjson.dumps({"name": "Account REST API Service", "version": "1.0"})
+
+
+@app.before_request
+def fast_path():
+    """Short-circuits the fixed endpoints before view dispatch"""
+    if request.method == "GET":
+        if request.path == "/health":
+            return app.response_class(_HEALTH_BODY, mimetype="application/json")
+        if request.path == "/":
+            return app.response_class(_INDEX_BODY, mimetype="application/json")
+    return None
+
+
 ############################################################
 # Health Endpoint
 ############################################################
 @app.route("/health")
 def health():
     """Health Status"""
-    return jsonify(dict(status="OK")), status.HTTP_200_OK
+    return app.response_class(
+        _HEALTH_BODY, status=status.HTTP_200_OK, mimetype="application/json"
+    )
 
 
 ######################################################################
@@ -25,13 +84,8 @@ def health():
 @app.route("/")
 def index():
     """Root URL response"""
-    return (
-        jsonify(
-            name="Account REST API Service",
-            version="1.0",
-            # paths=url_for("list_accounts", _external=True),
-        ),
-        status.HTTP_200_OK,
+    return app.response_class(
+        _INDEX_BODY, status=status.HTTP_200_OK, mimetype="application/json"
     )
 
 
@@ -46,18 +100,92 @@ def create_accounts():
     """
     app.logger.info("Request to create an Account")
     check_content_type("application/json")
-    account = Account()
-    account.deserialize(request.get_json())
+    payload = _decode_payload(Union[AccountIn, List[AccountIn]])
+    if isinstance(payload, list):
+        return create_account_batch(payload)
+    # pylint: disable=unexpected-keyword-arg
+    account = Account(
+        name=payload.name,
+        email=payload.email,
+        address=payload.address,
+        phone_number=payload.phone_number,
+        date_joined=payload.date_joined or date.today(),
+    )
     account.create()
     message = account.serialize()
     # Uncomment once get_accounts has been implemented
     # location_url = url_for("get_accounts", account_id=account.id, _external=True)
     location_url = "/"  # Remove once get_accounts has been implemented
-    return make_response(
-        jsonify(message), status.HTTP_201_CREATED, {"Location": location_url}
+    return _json_response(
+        message, status.HTTP_201_CREATED, {"Location": location_url}
     )
 
 
+def create_account_batch(payload):
+    """
+    Creates a batch of Accounts from a list of AccountIn structs
+
+    One multi-VALUES statement amortizes the round-trip and commit
+    cost that N separate POSTs would pay per account.
+    """
+    if not payload:
+        abort(status.HTTP_400_BAD_REQUEST, "Request body must not be an empty list")
+
+    rows = [
+        {
+            "name": item.name,
+            "email": item.email,
+            "address": item.address,
+            "phone_number": item.phone_number,
+            "date_joined": item.date_joined or date.today(),
+        }
+        for item in payload
+    ]
+
+    stmt = insert(Account.__table__).values(rows).returning(Account.__table__.c.id)
+    ids = db.session.execute(stmt).scalars().all()
+    db.session.commit()
+
+    message = [{"id": account_id, **row} for account_id, row in zip(ids, rows)]
+    return _json_response(message, status.HTTP_201_CREATED, {"Location": "/"})
+
+
+######################################################################
+# IMPORT ACCOUNTS FROM CSV
+######################################################################
+@app.route("/accounts/import", methods=["POST"])
+def import_accounts():
+    """
+    Imports Accounts from a CSV request body
+
+    Expects rows of name,email,address,phone_number,date_joined with
+    no header line. The raw bytes are streamed straight into Postgres
+    with COPY, so no per-row Python objects are allocated.
+    """
+    app.logger.info("Request to import Accounts from CSV")
+    check_content_type("text/csv")
+    data = request.get_data(cache=False)
+    if not data:
+        abort(status.HTTP_400_BAD_REQUEST, "Request body must not be empty")
+
+    connection = db.session.connection().connection
+    try:
+        with connection.cursor() as cursor:
+            cursor.copy_expert(
+                "COPY account (name, email, address, phone_number, date_joined) "
+                "FROM STDIN WITH (FORMAT csv)",
+                io.BytesIO(data),
+            )
+            imported = cursor.rowcount
+        db.session.commit()
+    except psycopg2.Error as error:
+        db.session.rollback()
+        raise DataValidationError("Invalid CSV data: " + str(error)) from error
+
+    app.logger.info("Imported %d accounts", imported)
+    return _json_response({"imported": imported}, status.HTTP_201_CREATED)
+
+
 ######################################################################
 # LIST ALL ACCOUNTS
 ######################################################################
@@ -68,20 +196,17 @@ def list_all_accounts():
     """Gets all accounts"""
     app.logger.info("All accounts requested")
 
-    result = Account.all()
-    accounts = []
+    # Core query returns plain rows, skipping ORM object hydration;
+    # orjson stringifies the date_joined column natively
+    rows = db.session.execute(
+        text("SELECT id, name, email, address, phone_number, date_joined FROM account")
+    ).mappings()
+    accounts = [dict(row) for row in rows]
 
-    if not result:
-        return jsonify(accounts), status.HTTP_200_OK
-        app.logger.info("No accounts found")
+    if app.logger.isEnabledFor(logging.INFO):
+        app.logger.info("Number of accounts returned is %d", len(accounts))
 
-    for account in result:
-        accounts = accounts + [account.serialize()]
-
-    number_accounts = len(accounts)
-    app.logger.info(f"Number of accounts returned is {number_accounts}")
-
-    return jsonify(accounts), status.HTTP_200_OK
+    return _conditional_response(accounts)
 
 
 ######################################################################
@@ -91,15 +216,22 @@ def list_all_accounts():
 @app.route("/accounts/<int:acc_id>", methods=["GET"])
 def read_an_account(acc_id):
     """ Gets an Account """
-    app.logger.info(f"account requested is {acc_id}")
+    app.logger.info("account requested is %s", acc_id)
 
-    result = Account.find(acc_id)
-    if not result:
+    # a plain primary-key SELECT skips ORM instance construction
+    row = db.session.execute(
+        text(
+            "SELECT id, name, email, address, phone_number, date_joined "
+            "FROM account WHERE id=:id"
+        ),
+        {"id": acc_id},
+    ).mappings().first()
+    if row is None:
         abort(status.HTTP_404_NOT_FOUND, f"Account id [{acc_id}] could not be found")
 
-    app.logger.info(f"account found was {result.name}")
+    app.logger.info("account found was %s", row["name"])
 
-    return result.serialize(), status.HTTP_200_OK
+    return _conditional_response(dict(row))
 
 
 ######################################################################
@@ -111,17 +243,37 @@ def read_an_account(acc_id):
 def update_account(account_id):
     """Updates an account"""
 
-    app.logger.info(f"account to be updated is {account_id}")
+    app.logger.info("account to be updated is %s", account_id)
 
-    result = Account.find(account_id)
-    if not result:
+    data = _decode_payload(AccountIn)
+    stmt = text(
+        "UPDATE account SET name=:name, email=:email, address=:address, "
+        "phone_number=:phone, date_joined=:dj WHERE id=:id "
+        "RETURNING id, name, email, address, phone_number, date_joined"
+    )
+    params = {
+        "name": data.name,
+        "email": data.email,
+        "address": data.address,
+        "phone": data.phone_number,
+        "dj": data.date_joined or date.today(),
+        "id": account_id,
+    }
+
+    row = db.session.execute(stmt, params).first()
+    db.session.commit()
+    if row is None:
         abort(status.HTTP_404_NOT_FOUND, f"Account id [{account_id}] could not be found")
 
-    account = Account()
-    account.deserialize(request.get_json())
-    account.update()
-
-    return account.serialize(), status.HTTP_200_OK
+    account = {
+        "id": row.id,
+        "name": row.name,
+        "email": row.email,
+        "address": row.address,
+        "phone_number": row.phone_number,
+        "date_joined": row.date_joined.isoformat(),
+    }
+    return _json_response(account)
 
 
 ######################################################################
@@ -133,27 +285,80 @@ def update_account(account_id):
 def delete_account(account_id):
     """Deletes and account"""
 
-    app.logger.info(f"account to be deleted is {account_id}")
+    app.logger.info("account to be deleted is %s", account_id)
 
-    result = Account.find(account_id)
-    if not result:
+    result = db.session.execute(
+        text("DELETE FROM account WHERE id=:id"), {"id": account_id}
+    )
+    if result.rowcount == 0:
         abort(status.HTTP_404_NOT_FOUND, f"Account id [{account_id}] could not be found")
+    db.session.commit()
 
-    result.delete()
-    result_return = ""
-    return result_return, status.HTTP_204_NO_CONTENT
+    return "", status.HTTP_204_NO_CONTENT
 
 ######################################################################
 #  U T I L I T Y   F U N C T I O N S
 ######################################################################
 
 
-def check_content_type(media_type):
+def _make_etag(body):
+    """Computes an ETag from the response body bytes"""
+    return hashlib.blake2b(body, digest_size=8).hexdigest()
+
+
+def _set_cache_headers(resp, etag):
+    """Stamps an ETag and a short max-age onto a response"""
+    resp.set_etag(etag)
+    resp.cache_control.max_age = 30
+    return resp
+
+
+def _etag_matches(etag):
+    """Checks If-None-Match against our ETag
+
+    Flask-Compress rewrites the ETag of compressed responses to
+    '<etag>:<algorithm>', so clients echo the suffixed form back;
+    strip the suffix before comparing.
+    """
+    if_none_match = request.if_none_match
+    if if_none_match.contains(etag):
+        return True
+    return any(tag.rsplit(":", 1)[0] == etag for tag in if_none_match)
+
+
+def _conditional_response(data):
+    """Returns data as JSON, or an empty 304 if the client's ETag matches
+
+    The ETag is a hash of the encoded body, so any change to the row
+    content invalidates it. Per RFC 7232 the 304 repeats the ETag.
+    """
+    body = orjson.dumps(data)
+    etag = _make_etag(body)
+    if _etag_matches(etag):
+        resp = app.response_class(status=status.HTTP_304_NOT_MODIFIED)
+    else:
+        resp = app.response_class(body, mimetype="application/json")
+    return _set_cache_headers(resp, etag)
+
+
+def _json_response(data, status_code=status.HTTP_200_OK, headers=None):
+    """Builds a JSON response with orjson, bypassing the stdlib encoder"""
+    return app.response_class(
+        orjson.dumps(data),
+        status=status_code,
+        headers=headers,
+        mimetype="application/json",
+    )
+
+
+def check_content_type(media_type, _expected=sys.intern("application/json")):
     """Checks that the media type is correct"""
-    content_type = request.headers.get("Content-Type")
-    if content_type and content_type == media_type:
+    # request.mimetype is already parsed and cached by werkzeug, so the
+    # common case is a single identity check against the interned constant
+    mimetype = request.mimetype
+    if mimetype is _expected or mimetype == media_type:
         return
-    app.logger.error("Invalid Content-Type: %s", content_type)
+    app.logger.error("Invalid Content-Type: %s", mimetype)
     abort(
         status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
         f"Content-Type must be {media_type}",
@@ -8,6 +8,7 @@ Test cases can be run with the following:
 import os
 import logging
 from unittest import TestCase
+from sqlalchemy import insert, text
 from tests.factories import AccountFactory
 from service.common import status  # HTTP Status Codes
 from service.models import db, Account, init_db
@@ -39,6 +40,7 @@ class TestAccountService(TestCase):
         app.logger.setLevel(logging.CRITICAL)
         init_db(app)
         talisman.force_https = False
+        cls.client = app.test_client()
 
     @classmethod
     def tearDownClass(cls):
@@ -46,11 +48,10 @@ class TestAccountService(TestCase):
 
     def setUp(self):
         """Runs before each test"""
-        db.session.query(Account).delete()  # clean up the last tests
+        # one TRUNCATE beats a row-by-row DELETE between tests
+        db.session.execute(text("TRUNCATE account RESTART IDENTITY CASCADE"))
         db.session.commit()
 
-        self.client = app.test_client()
-
     def tearDown(self):
         """Runs once after each test case"""
         db.session.remove()
@@ -60,19 +61,28 @@ class TestAccountService(TestCase):
     ######################################################################
 
     def _create_accounts(self, count):
-        """Factory method to create accounts in bulk"""
-        accounts = []
-        for _ in range(count):
-            account = AccountFactory()
-            response = self.client.post(BASE_URL, json=account.serialize())
-            self.assertEqual(
-                response.status_code,
-                status.HTTP_201_CREATED,
-                "Could not create test Account",
-            )
-            new_account = response.get_json()
-            account.id = new_account["id"]
-            accounts.append(account)
+        """Factory method to create accounts in bulk
+
+        Inserts directly into the database with one INSERT instead of
+        going through HTTP, so fixture setup costs a single round-trip.
+        Tests that exercise the POST path issue their own requests.
+        """
+        accounts = [AccountFactory() for _ in range(count)]
+        data = [
+            {
+                "name": account.name,
+                "email": account.email,
+                "address": account.address,
+                "phone_number": account.phone_number,
+                "date_joined": account.date_joined,
+            }
+            for account in accounts
+        ]
+        stmt = insert(Account.__table__).values(data).returning(Account.__table__.c.id)
+        ids = db.session.execute(stmt).scalars().all()
+        db.session.commit()
+        for account, account_id in zip(accounts, ids):
+            account.id = account_id
         return accounts
 
     ######################################################################
@@ -113,6 +123,45 @@ class TestAccountService(TestCase):
         self.assertEqual(new_account["phone_number"], account.phone_number)
         self.assertEqual(new_account["date_joined"], str(account.date_joined))
 
+    def test_create_account_batch(self):
+        """It should Create several Accounts from a JSON list"""
+        accounts = [AccountFactory() for _ in range(3)]
+        response = self.client.post(
+            BASE_URL,
+            json=[account.serialize() for account in accounts],
+            content_type="application/json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        data = response.get_json()
+        self.assertEqual(len(data), 3)
+        for account, new_account in zip(accounts, data):
+            self.assertIsNotNone(new_account["id"])
+            self.assertEqual(new_account["name"], account.name)
+            self.assertEqual(new_account["email"], account.email)
+
+    def test_create_account_batch_empty(self):
+        """It should not Create Accounts from an empty list"""
+        response = self.client.post(BASE_URL, json=[])
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_import_accounts(self):
+        """It should import Accounts from a CSV body"""
+        csv_body = "John Doe,john@example.com,123 Main St,555-1212,2022-01-01\n"
+        response = self.client.post(
+            "/accounts/import", data=csv_body, content_type="text/csv"
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.get_json()["imported"], 1)
+        response = self.client.get(BASE_URL)
+        self.assertEqual(len(response.get_json()), 1)
+
+    def test_import_accounts_empty(self):
+        """It should not import an empty CSV body"""
+        response = self.client.post(
+            "/accounts/import", data="", content_type="text/csv"
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
     def test_bad_request(self):
         """It should not Create an Account when sending the wrong data"""
         response = self.client.post(BASE_URL, json={"name": "not enough data"})
@@ -142,6 +191,53 @@ class TestAccountService(TestCase):
         response = self.client.get(f"{BASE_URL}/{false_account}", content_type="application/json")
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
 
+    def test_read_account_not_modified(self):
+        """it should return 304 when the ETag matches"""
+        account = self._create_accounts(1)[0]
+        response = self.client.get(f"{BASE_URL}/{account.id}")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        etag = response.headers.get("ETag")
+        self.assertIsNotNone(etag)
+        response = self.client.get(
+            f"{BASE_URL}/{account.id}", headers={"If-None-Match": etag}
+        )
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response.headers.get("ETag"), etag)
+
+    def test_list_not_modified_when_compressed(self):
+        """it should return 304 for a compressed list response"""
+        self._create_accounts(25)  # enough rows to exceed COMPRESS_MIN_SIZE
+        response = self.client.get(BASE_URL, headers={"Accept-Encoding": "gzip"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.headers.get("Content-Encoding"), "gzip")
+        etag = response.headers.get("ETag")
+        self.assertIsNotNone(etag)
+        response = self.client.get(
+            BASE_URL, headers={"Accept-Encoding": "gzip", "If-None-Match": etag}
+        )
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_etag_changes_after_update(self):
+        """it should not return 304 with a stale ETag after an update"""
+        account = self._create_accounts(1)[0]
+        read_etag = self.client.get(f"{BASE_URL}/{account.id}").headers.get("ETag")
+        list_etag = self.client.get(BASE_URL).headers.get("ETag")
+
+        data = account.serialize()
+        data["name"] = "Updated Name"
+        response = self.client.put(f"{BASE_URL}/{account.id}", json=data)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        # revalidating with the pre-update ETags must serve fresh data
+        response = self.client.get(
+            f"{BASE_URL}/{account.id}", headers={"If-None-Match": read_etag}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.get_json()["name"], "Updated Name")
+        response = self.client.get(BASE_URL, headers={"If-None-Match": list_etag})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.get_json()[0]["name"], "Updated Name")
+
     def test_List_all_accounts(self):
         """It should list all accounts in DB"""
         self._create_accounts(2)